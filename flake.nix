@@ -20,7 +20,10 @@
           ps.backoff
           ps.beautifulsoup4
           ps.httpx
+          ps.h2
+          ps.lxml
           ps.ndjson
+          ps.orjson
           ps.pydantic
           ps.requests
         ]);
@@ -31,11 +34,16 @@
           ps.backoff
           ps.beautifulsoup4
           ps.httpx
+          ps.h2
+          ps.lxml
           ps.ndjson
+          ps.orjson
           ps.pydantic
           ps.requests
           ps.pytest
           ps.pytest-mock
+          ps.pytest-socket
+          ps.pytest-xdist
         ]);
 
       mkSubmitEnv =
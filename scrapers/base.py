@@ -134,7 +134,16 @@ class BaseScraper(ABC):
     def _login_error(self, msg: str) -> LoginResult:
         return LoginResult(success=False, error=msg)
 
+    async def aclose(self) -> None:
+        pass
+
     async def _run_cli_async(self, args: list[str]) -> int:
+        try:
+            return await self._dispatch_cli_async(args)
+        finally:
+            await self.aclose()
+
+    async def _dispatch_cli_async(self, args: list[str]) -> int:
         if len(args) < 2:
             print(self._metadata_error(self._usage()).model_dump_json())
             return 1
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 from .base import (
     BaseScraper,
@@ -23,7 +24,6 @@ from .models import (
     MetadataResult,
     ProblemSummary,
     SubmitResult,
-    TestCase,
 )
 
 BASE_URL = "https://www.codechef.com"
@@ -36,6 +36,10 @@ HEADERS = {
 }
 CONNECTIONS = 8
 
+_START_RE = re.compile(r"^START\d+")
+_START_PARENT_RE = re.compile(r"^START\d+$")
+_NAME_SUFFIX_RE = re.compile(r"\s*\(.*?\)\s*$")
+
 
 _CC_CHECK_LOGIN_JS = "() => !!document.querySelector('a[href*=\"/users/\"]')"
 
@@ -53,7 +57,7 @@ _CC_LANG_IDS: dict[str, str] = {
 
 
 async def fetch_json(client: httpx.AsyncClient, path: str) -> dict[str, Any]:
-    r = await client.get(BASE_URL + path, headers=HEADERS, timeout=HTTP_TIMEOUT)
+    r = await client.get(path)
     r.raise_for_status()
     return r.json()
 
@@ -290,16 +294,36 @@ def _submit_headless_codechef(
 
 
 class CodeChefScraper(BaseScraper):
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+
     @property
     def platform_name(self) -> str:
         return "codechef"
 
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=BASE_URL,
+                headers=HEADERS,
+                timeout=HTTP_TIMEOUT,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=CONNECTIONS,
+                    max_keepalive_connections=CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def scrape_contest_metadata(self, contest_id: str) -> MetadataResult:
         try:
-            async with httpx.AsyncClient() as client:
-                data = await fetch_json(
-                    client, API_CONTEST.format(contest_id=contest_id)
-                )
+            client = self._get_client()
+            data = await fetch_json(client, API_CONTEST.format(contest_id=contest_id))
             problems_raw = data.get("problems")
             if not problems_raw and isinstance(data.get("child_contests"), dict):
                 for div in ("div_4", "div_3", "div_2", "div_1"):
@@ -333,101 +357,96 @@ class CodeChefScraper(BaseScraper):
             return self._metadata_error(f"Failed to fetch contest {contest_id}: {e}")
 
     async def scrape_contest_list(self) -> ContestListResult:
-        async with httpx.AsyncClient(
-            limits=httpx.Limits(max_connections=CONNECTIONS)
-        ) as client:
-            try:
-                data = await fetch_json(client, API_CONTESTS_ALL)
-            except httpx.HTTPStatusError as e:
-                return self._contests_error(f"Failed to fetch contests: {e}")
-
-            present = data.get("present_contests", [])
-            future = data.get("future_contests", [])
-
-            async def fetch_past_page(offset: int) -> list[dict[str, Any]]:
-                r = await client.get(
-                    BASE_URL + API_CONTESTS_PAST,
-                    params={
-                        "sort_by": "START",
-                        "sorting_order": "desc",
-                        "offset": offset,
-                    },
-                    headers=HEADERS,
-                    timeout=HTTP_TIMEOUT,
-                )
-                r.raise_for_status()
-                return r.json().get("contests", [])
-
-            past: list[dict[str, Any]] = []
-            offset = 0
-            while True:
-                page = await fetch_past_page(offset)
-                past.extend(
-                    c for c in page if re.match(r"^START\d+", c.get("contest_code", ""))
-                )
-                if len(page) < 20:
-                    break
-                offset += 20
-
-            raw: list[dict[str, Any]] = []
-            seen_raw: set[str] = set()
-            for c in present + future + past:
-                code = c.get("contest_code", "")
-                if not code or code in seen_raw:
-                    continue
-                seen_raw.add(code)
-                raw.append(c)
-
-            sem = asyncio.Semaphore(CONNECTIONS)
-
-            async def expand(c: dict[str, Any]) -> list[ContestSummary]:
-                code = c["contest_code"]
-                name = c.get("contest_name", code)
-                start_time: int | None = None
-                iso = c.get("contest_start_date_iso")
-                if iso:
-                    try:
-                        start_time = int(datetime.fromisoformat(iso).timestamp())
-                    except Exception:
-                        pass
-                base_name = re.sub(r"\s*\(.*?\)\s*$", "", name).strip()
+        client = self._get_client()
+        try:
+            data = await fetch_json(client, API_CONTESTS_ALL)
+        except httpx.HTTPStatusError as e:
+            return self._contests_error(f"Failed to fetch contests: {e}")
+
+        present = data.get("present_contests", [])
+        future = data.get("future_contests", [])
+
+        async def fetch_past_page(offset: int) -> list[dict[str, Any]]:
+            r = await client.get(
+                API_CONTESTS_PAST,
+                params={
+                    "sort_by": "START",
+                    "sorting_order": "desc",
+                    "offset": offset,
+                },
+            )
+            r.raise_for_status()
+            return r.json().get("contests", [])
+
+        past: list[dict[str, Any]] = []
+        offset = 0
+        while True:
+            page = await fetch_past_page(offset)
+            past.extend(c for c in page if _START_RE.match(c.get("contest_code", "")))
+            if len(page) < 20:
+                break
+            offset += 20
+
+        raw: list[dict[str, Any]] = []
+        seen_raw: set[str] = set()
+        for c in present + future + past:
+            code = c.get("contest_code", "")
+            if not code or code in seen_raw:
+                continue
+            seen_raw.add(code)
+            raw.append(c)
+
+        sem = asyncio.Semaphore(CONNECTIONS)
+
+        async def expand(c: dict[str, Any]) -> list[ContestSummary]:
+            code = c["contest_code"]
+            name = c.get("contest_name", code)
+            start_time: int | None = None
+            iso = c.get("contest_start_date_iso")
+            if iso:
                 try:
-                    async with sem:
-                        detail = await fetch_json(
-                            client, API_CONTEST.format(contest_id=code)
-                        )
-                    children = detail.get("child_contests")
-                    if children and isinstance(children, dict):
-                        divs: list[ContestSummary] = []
-                        for div_key in ("div_1", "div_2", "div_3", "div_4"):
-                            child = children.get(div_key)
-                            if not child:
-                                continue
-                            child_code = child.get("contest_code")
-                            div_num = child.get("div", {}).get(
-                                "div_number", div_key[-1]
-                            )
-                            if child_code:
-                                display = f"{base_name} (Div. {div_num})"
-                                divs.append(
-                                    ContestSummary(
-                                        id=child_code,
-                                        name=display,
-                                        display_name=display,
-                                        start_time=start_time,
-                                    )
-                                )
-                        if divs:
-                            return divs
+                    start_time = int(datetime.fromisoformat(iso).timestamp())
                 except Exception:
                     pass
-                return [
-                    ContestSummary(
-                        id=code, name=name, display_name=name, start_time=start_time
+            plain = [
+                ContestSummary(
+                    id=code, name=name, display_name=name, start_time=start_time
+                )
+            ]
+            if not _START_PARENT_RE.match(code):
+                return plain
+            base_name = _NAME_SUFFIX_RE.sub("", name).strip()
+            try:
+                async with sem:
+                    detail = await fetch_json(
+                        client, API_CONTEST.format(contest_id=code)
                     )
-                ]
+                children = detail.get("child_contests")
+                if children and isinstance(children, dict):
+                    divs: list[ContestSummary] = []
+                    for div_key in ("div_1", "div_2", "div_3", "div_4"):
+                        child = children.get(div_key)
+                        if not child:
+                            continue
+                        child_code = child.get("contest_code")
+                        div_num = child.get("div", {}).get("div_number", div_key[-1])
+                        if child_code:
+                            display = f"{base_name} (Div. {div_num})"
+                            divs.append(
+                                ContestSummary(
+                                    id=child_code,
+                                    name=display,
+                                    display_name=display,
+                                    start_time=start_time,
+                                )
+                            )
+                    if divs:
+                        return divs
+            except Exception:
+                pass
+            return plain
 
-            results = await asyncio.gather(*[expand(c) for c in raw])
+        results = await asyncio.gather(*[expand(c) for c in raw])
 
         contests: list[ContestSummary] = []
         seen: set[str] = set()
@@ -442,112 +461,108 @@ class CodeChefScraper(BaseScraper):
         return ContestListResult(success=True, error="", contests=contests)
 
     async def stream_tests_for_category_async(self, category_id: str) -> None:
-        async with httpx.AsyncClient(
-            limits=httpx.Limits(max_connections=CONNECTIONS)
-        ) as client:
+        client = self._get_client()
+        try:
+            contest_data = await fetch_json(
+                client, API_CONTEST.format(contest_id=category_id)
+            )
+        except Exception as e:
+            print(
+                orjson.dumps(
+                    {"error": f"Failed to fetch contest {category_id}: {str(e)}"}
+                ).decode(),
+                flush=True,
+            )
+            return
+        all_problems = contest_data.get("problems", {})
+        if not all_problems and isinstance(contest_data.get("child_contests"), dict):
+            for div in ("div_4", "div_3", "div_2", "div_1"):
+                child = contest_data["child_contests"].get(div, {})
+                child_code = child.get("contest_code")
+                if child_code:
+                    await self.stream_tests_for_category_async(child_code)
+                    return
+        if not all_problems:
+            print(
+                orjson.dumps(
+                    {"error": f"No problems found for contest {category_id}"}
+                ).decode(),
+                flush=True,
+            )
+            return
+        problems = {
+            code: data
+            for code, data in all_problems.items()
+            if data.get("category_name") == "main"
+        }
+        if not problems:
+            print(
+                orjson.dumps(
+                    {"error": f"No main problems found for contest {category_id}"}
+                ).decode(),
+                flush=True,
+            )
+            return
+        sem = asyncio.Semaphore(CONNECTIONS)
+
+        async def run_one(problem_code: str) -> dict[str, Any]:
+            inputs: list[str] = []
+            expecteds: list[str] = []
+            tests: list[dict[str, str]] = []
             try:
-                contest_data = await fetch_json(
-                    client, API_CONTEST.format(contest_id=category_id)
-                )
-            except Exception as e:
-                print(
-                    json.dumps(
-                        {"error": f"Failed to fetch contest {category_id}: {str(e)}"}
-                    ),
-                    flush=True,
-                )
-                return
-            all_problems = contest_data.get("problems", {})
-            if not all_problems and isinstance(
-                contest_data.get("child_contests"), dict
-            ):
-                for div in ("div_4", "div_3", "div_2", "div_1"):
-                    child = contest_data["child_contests"].get(div, {})
-                    child_code = child.get("contest_code")
-                    if child_code:
-                        await self.stream_tests_for_category_async(child_code)
-                        return
-            if not all_problems:
-                print(
-                    json.dumps(
-                        {"error": f"No problems found for contest {category_id}"}
-                    ),
-                    flush=True,
+                async with sem:
+                    problem_data = await fetch_json(
+                        client,
+                        API_PROBLEM.format(
+                            contest_id=category_id, problem_id=problem_code
+                        ),
+                    )
+                sample_tests = (
+                    problem_data.get("problemComponents", {}).get("sampleTestCases", [])
+                    or []
                 )
-                return
-            problems = {
-                code: data
-                for code, data in all_problems.items()
-                if data.get("category_name") == "main"
+                for t in sample_tests:
+                    if t.get("isDeleted", False):
+                        continue
+                    ti = t.get("input", "").strip()
+                    to = t.get("output", "").strip()
+                    inputs.append(ti)
+                    expecteds.append(to)
+                    tests.append({"input": ti, "expected": to})
+                time_limit_str = problem_data.get("max_timelimit", "1")
+                timeout_ms = int(float(time_limit_str) * 1000)
+                memory_mb = 256.0
+                interactive = False
+                precision = None
+            except Exception:
+                inputs, expecteds, tests = [], [], []
+                timeout_ms = 1000
+                memory_mb = 256.0
+                interactive = False
+                precision = None
+            return {
+                "problem_id": problem_code,
+                "combined": {
+                    "input": "\n".join(inputs),
+                    "expected": "\n".join(expecteds),
+                },
+                "tests": tests,
+                "timeout_ms": timeout_ms,
+                "memory_mb": memory_mb,
+                "interactive": interactive,
+                "multi_test": False,
+                "precision": precision,
             }
-            if not problems:
-                print(
-                    json.dumps(
-                        {"error": f"No main problems found for contest {category_id}"}
-                    ),
-                    flush=True,
-                )
-                return
-            sem = asyncio.Semaphore(CONNECTIONS)
 
-            async def run_one(problem_code: str) -> dict[str, Any]:
-                async with sem:
-                    try:
-                        problem_data = await fetch_json(
-                            client,
-                            API_PROBLEM.format(
-                                contest_id=category_id, problem_id=problem_code
-                            ),
-                        )
-                        sample_tests = (
-                            problem_data.get("problemComponents", {}).get(
-                                "sampleTestCases", []
-                            )
-                            or []
-                        )
-                        tests = [
-                            TestCase(
-                                input=t.get("input", "").strip(),
-                                expected=t.get("output", "").strip(),
-                            )
-                            for t in sample_tests
-                            if not t.get("isDeleted", False)
-                        ]
-                        time_limit_str = problem_data.get("max_timelimit", "1")
-                        timeout_ms = int(float(time_limit_str) * 1000)
-                        memory_mb = 256.0
-                        interactive = False
-                        precision = None
-                    except Exception:
-                        tests = []
-                        timeout_ms = 1000
-                        memory_mb = 256.0
-                        interactive = False
-                        precision = None
-                    combined_input = "\n".join(t.input for t in tests) if tests else ""
-                    combined_expected = (
-                        "\n".join(t.expected for t in tests) if tests else ""
-                    )
-                    return {
-                        "problem_id": problem_code,
-                        "combined": {
-                            "input": combined_input,
-                            "expected": combined_expected,
-                        },
-                        "tests": [
-                            {"input": t.input, "expected": t.expected} for t in tests
-                        ],
-                        "timeout_ms": timeout_ms,
-                        "memory_mb": memory_mb,
-                        "interactive": interactive,
-                        "multi_test": False,
-                        "precision": precision,
-                    }
-
-            tasks = [run_one(problem_code) for problem_code in problems.keys()]
-            for coro in asyncio.as_completed(tasks):
-                payload = await coro
-                print(json.dumps(payload), flush=True)
+        pending = {asyncio.create_task(run_one(code)) for code in problems}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            print(
+                "\n".join(orjson.dumps(task.result()).decode() for task in done),
+                flush=True,
+            )
 
     async def submit(
         self,
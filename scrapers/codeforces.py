@@ -3,10 +3,12 @@
 import asyncio
 import json
 import re
+from io import BytesIO
 from typing import Any
 
-import requests
-from bs4 import BeautifulSoup, Tag
+import httpx
+import orjson
+from lxml import etree  # ty: ignore[unresolved-import]
 
 from .base import (
     BaseScraper,
@@ -22,7 +24,6 @@ from .models import (
     MetadataResult,
     ProblemSummary,
     SubmitResult,
-    TestCase,
 )
 from .timeouts import (
     BROWSER_NAV_TIMEOUT,
@@ -37,87 +38,89 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
 }
 
+_TIME_RE = re.compile(r"(\d+)\s*seconds?", re.ASCII)
+_MEM_RE = re.compile(r"(\d+)\s*megabytes?", re.ASCII)
+_LINE_CLASS_PREFIX = "test-example-line-"
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_XP_HOLDER = etree.XPath(f"ancestor::div[{_has_class('problemindexholder')}][1]")
+_XP_STATEMENT = etree.XPath(f"(.//div[{_has_class('problem-statement')}])[1]")
+_XP_TITLE = etree.XPath(f"(.//div[{_has_class('title')}])[1]")
+_XP_TIME_LIMIT = etree.XPath(f"(.//div[{_has_class('time-limit')}])[1]")
+_XP_MEMORY_LIMIT = etree.XPath(f"(.//div[{_has_class('memory-limit')}])[1]")
+_XP_SAMPLE_TEST = etree.XPath(f"(.//div[{_has_class('sample-test')}])[1]")
+_XP_INPUT_PRES = etree.XPath(f".//div[{_has_class('input')}]/descendant::pre[1]")
+_XP_OUTPUT_PRES = etree.XPath(f".//div[{_has_class('output')}]/descendant::pre[1]")
+_XP_LINE_DIVS = etree.XPath(f".//div[{_has_class('test-example-line')}]")
+_XP_TEXT = etree.XPath("string()", smart_strings=False)
+
+
+def _first(xpath: etree.XPath, el: etree._Element) -> etree._Element | None:
+    found = xpath(el)
+    return found[0] if found else None
 
-def _text_from_pre(pre: Tag) -> str:
-    return (
-        pre.get_text(separator="\n", strip=False)
-        .replace("\r", "")
-        .replace("\xa0", " ")
-        .strip()
-    )
 
+def _stripped_text(el: etree._Element) -> str:
+    return " ".join(t for t in (s.strip() for s in el.itertext()) if t)
 
-def _extract_limits(block: Tag) -> tuple[int, float]:
-    tdiv = block.find("div", class_="time-limit")
-    mdiv = block.find("div", class_="memory-limit")
+
+def _text_from_pre(pre: etree._Element) -> str:
+    return "\n".join(pre.itertext()).replace("\r", "").replace("\xa0", " ").strip()
+
+
+def _extract_limits(block: etree._Element) -> tuple[int, float]:
+    tdiv = _first(_XP_TIME_LIMIT, block)
+    mdiv = _first(_XP_MEMORY_LIMIT, block)
     timeout_ms = 0
     memory_mb = 0.0
-    if tdiv:
-        ttxt = tdiv.get_text(" ", strip=True)
-        ts = re.search(r"(\d+)\s*seconds?", ttxt)
+    if tdiv is not None:
+        ttxt = _stripped_text(tdiv)
+        ts = _TIME_RE.search(ttxt)
         if ts:
             timeout_ms = int(ts.group(1)) * 1000
-    if mdiv:
-        mtxt = mdiv.get_text(" ", strip=True)
-        ms = re.search(r"(\d+)\s*megabytes?", mtxt)
+    if mdiv is not None:
+        mtxt = _stripped_text(mdiv)
+        ms = _MEM_RE.search(mtxt)
         if ms:
             memory_mb = float(ms.group(1))
     return timeout_ms, memory_mb
 
 
-def _group_lines_by_id(pre: Tag) -> dict[int, list[str]]:
+def _group_lines_by_id(pre: etree._Element) -> dict[int, list[str]]:
     groups: dict[int, list[str]] = {}
-    for div in pre.find_all("div", class_="test-example-line"):
-        class_attr = div.get("class")
-        if isinstance(class_attr, str):
-            cls = class_attr
-        elif class_attr is None:
-            cls = ""
-        else:
-            cls = " ".join(class_attr)
-        m = re.search(r"\btest-example-line-(\d+)\b", cls)
-        if not m:
-            continue
-        gid = int(m.group(1))
-        groups.setdefault(gid, []).append(div.get_text("", strip=False))
+    for div in _XP_LINE_DIVS(pre):
+        for cls in div.get("class", "").split():
+            gid = cls.removeprefix(_LINE_CLASS_PREFIX)
+            if gid != cls and gid.isdecimal():
+                groups.setdefault(int(gid), []).append(_XP_TEXT(div))
+                break
     return groups
 
 
-def _extract_title(block: Tag) -> tuple[str, str]:
-    t = block.find("div", class_="title")
-    if not t:
+def _extract_title(block: etree._Element) -> tuple[str, str]:
+    t = _first(_XP_TITLE, block)
+    if t is None:
         return "", ""
-    s = t.get_text(" ", strip=True)
+    s = _stripped_text(t)
     parts = s.split(".", 1)
     if len(parts) != 2:
         return "", s.strip()
     return parts[0].strip().upper(), parts[1].strip()
 
 
-def _extract_samples(block: Tag) -> tuple[list[TestCase], bool]:
-    st = block.find("div", class_="sample-test")
-    if not isinstance(st, Tag):
+def _extract_samples(block: etree._Element) -> tuple[list[dict[str, str]], bool]:
+    st = _first(_XP_SAMPLE_TEST, block)
+    if st is None:
         return [], False
 
-    input_pres: list[Tag] = []
-    for inp in st.find_all("div", class_="input"):
-        if not isinstance(inp, Tag):
-            continue
-        pre = inp.find("pre")
-        if isinstance(pre, Tag):
-            input_pres.append(pre)
-
-    output_pres: list[Tag] = []
-    for out in st.find_all("div", class_="output"):
-        if not isinstance(out, Tag):
-            continue
-        pre = out.find("pre")
-        if isinstance(pre, Tag):
-            output_pres.append(pre)
-
-    has_grouped = any(
-        p.find("div", class_="test-example-line") for p in input_pres + output_pres
-    )
+    input_pres = _XP_INPUT_PRES(st)
+    output_pres = _XP_OUTPUT_PRES(st)
+
+    has_grouped = any(_XP_LINE_DIVS(p) for p in input_pres + output_pres)
     if has_grouped:
         inputs_by_gid: dict[int, list[str]] = {}
         outputs_by_gid: dict[int, list[str]] = {}
@@ -134,10 +137,10 @@ def _extract_samples(block: Tag) -> tuple[list[TestCase], bool]:
         keys = sorted(set(inputs_by_gid.keys()) & set(outputs_by_gid.keys()))
         if keys:
             samples = [
-                TestCase(
-                    input="\n".join(inputs_by_gid[k]).strip(),
-                    expected="\n".join(outputs_by_gid[k]).strip(),
-                )
+                {
+                    "input": "\n".join(inputs_by_gid[k]).strip(),
+                    "expected": "\n".join(outputs_by_gid[k]).strip(),
+                }
                 for k in keys
             ]
             return samples, True
@@ -145,12 +148,12 @@ def _extract_samples(block: Tag) -> tuple[list[TestCase], bool]:
     inputs = [_text_from_pre(p) for p in input_pres]
     outputs = [_text_from_pre(p) for p in output_pres]
     n = min(len(inputs), len(outputs))
-    return [TestCase(input=inputs[i], expected=outputs[i]) for i in range(n)], False
+    return [{"input": inputs[i], "expected": outputs[i]} for i in range(n)], False
 
 
-def _is_interactive(block: Tag) -> bool:
-    ps = block.find("div", class_="problem-statement")
-    txt = ps.get_text(" ", strip=True) if ps else block.get_text(" ", strip=True)
+def _is_interactive(block: etree._Element) -> bool:
+    ps = _first(_XP_STATEMENT, block)
+    txt = _stripped_text(ps) if ps is not None else _stripped_text(block)
     return "This is an interactive problem" in txt
 
 
@@ -181,76 +184,97 @@ def _fetch_problems_html(contest_id: str) -> str:
     return html
 
 
+def _parse_block(b: etree._Element) -> dict[str, Any] | None:
+    holder = _first(_XP_HOLDER, b)
+    problemindex = holder.get("problemindex") if holder is not None else None
+    if isinstance(problemindex, str):
+        letter = problemindex.strip().upper()
+    else:
+        letter = ""
+    name = _extract_title(b)[1]
+    if not letter:
+        return None
+    raw_samples, is_grouped = _extract_samples(b)
+    timeout_ms, memory_mb = _extract_limits(b)
+    interactive = _is_interactive(b)
+    precision = extract_precision(_stripped_text(b))
+
+    if is_grouped and raw_samples:
+        combined_input = f"{len(raw_samples)}\n" + "\n".join(
+            tc["input"] for tc in raw_samples
+        )
+        combined_expected = "\n".join(tc["expected"] for tc in raw_samples)
+        individual_tests = [
+            {"input": f"1\n{tc['input']}", "expected": tc["expected"]}
+            for tc in raw_samples
+        ]
+    else:
+        combined_input = "\n".join(tc["input"] for tc in raw_samples)
+        combined_expected = "\n".join(tc["expected"] for tc in raw_samples)
+        individual_tests = raw_samples
+
+    return {
+        "letter": letter,
+        "name": name,
+        "combined_input": combined_input,
+        "combined_expected": combined_expected,
+        "tests": individual_tests,
+        "timeout_ms": timeout_ms,
+        "memory_mb": memory_mb,
+        "interactive": interactive,
+        "multi_test": is_grouped,
+        "precision": precision,
+    }
+
+
 def _parse_all_blocks(html: str) -> list[dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
-    blocks = soup.find_all("div", class_="problem-statement")
+    if not html.strip():
+        return []
     out: list[dict[str, Any]] = []
-    for b in blocks:
-        holder = b.find_parent("div", class_="problemindexholder")
-        problemindex = holder.get("problemindex") if holder else None
-        if isinstance(problemindex, str):
-            letter = problemindex.strip().upper()
-        else:
-            letter = ""
-        name = _extract_title(b)[1]
-        if not letter:
-            continue
-        raw_samples, is_grouped = _extract_samples(b)
-        timeout_ms, memory_mb = _extract_limits(b)
-        interactive = _is_interactive(b)
-        precision = extract_precision(b.get_text(" ", strip=True))
-
-        if is_grouped and raw_samples:
-            combined_input = f"{len(raw_samples)}\n" + "\n".join(
-                tc.input for tc in raw_samples
-            )
-            combined_expected = "\n".join(tc.expected for tc in raw_samples)
-            individual_tests = [
-                TestCase(input=f"1\n{tc.input}", expected=tc.expected)
-                for tc in raw_samples
-            ]
-        else:
-            combined_input = "\n".join(tc.input for tc in raw_samples)
-            combined_expected = "\n".join(tc.expected for tc in raw_samples)
-            individual_tests = raw_samples
-
-        out.append(
-            {
-                "letter": letter,
-                "name": name,
-                "combined_input": combined_input,
-                "combined_expected": combined_expected,
-                "tests": individual_tests,
-                "timeout_ms": timeout_ms,
-                "memory_mb": memory_mb,
-                "interactive": interactive,
-                "multi_test": is_grouped,
-                "precision": precision,
-            }
-        )
+    for _, el in etree.iterparse(
+        BytesIO(html.encode()),
+        events=("end",),
+        tag="div",
+        html=True,
+        encoding="utf-8",
+    ):
+        classes = el.get("class", "").split()
+        if "problem-statement" in classes:
+            block = _parse_block(el)
+            if block is not None:
+                out.append(block)
+        elif "problemindexholder" in classes:
+            el.clear(keep_tail=True)
+            while el.getprevious() is not None:
+                del el.getparent()[0]
     return out
 
 
-def _scrape_contest_problems_sync(contest_id: str) -> list[ProblemSummary]:
-    html = _fetch_problems_html(contest_id)
-    blocks = _parse_all_blocks(html)
-    problems: list[ProblemSummary] = []
-    for b in blocks:
-        pid = b["letter"].upper()
-        problems.append(ProblemSummary(id=pid.lower(), name=b["name"]))
-    return problems
+def _fetch_blocks_sync(contest_id: str) -> list[dict[str, Any]]:
+    return _parse_all_blocks(_fetch_problems_html(contest_id))
 
 
 class CodeforcesScraper(BaseScraper):
+    def __init__(self) -> None:
+        self._block_cache: dict[str, list[dict[str, Any]]] = {}
+
     @property
     def platform_name(self) -> str:
         return "codeforces"
 
+    async def _get_blocks(self, contest_id: str) -> list[dict[str, Any]]:
+        blocks = self._block_cache.get(contest_id)
+        if blocks is None:
+            blocks = await asyncio.to_thread(_fetch_blocks_sync, contest_id)
+            self._block_cache[contest_id] = blocks
+        return blocks
+
     async def scrape_contest_metadata(self, contest_id: str) -> MetadataResult:
         try:
-            problems = await asyncio.to_thread(
-                _scrape_contest_problems_sync, contest_id
-            )
+            blocks = await self._get_blocks(contest_id)
+            problems = [
+                ProblemSummary(id=b["letter"].lower(), name=b["name"]) for b in blocks
+            ]
             if not problems:
                 return self._metadata_error(
                     f"No problems found for contest {contest_id}"
@@ -269,7 +293,10 @@ class CodeforcesScraper(BaseScraper):
 
     async def scrape_contest_list(self) -> ContestListResult:
         try:
-            r = requests.get(API_CONTEST_LIST_URL, timeout=HTTP_TIMEOUT)
+            async with httpx.AsyncClient() as client:
+                r = await client.get(
+                    API_CONTEST_LIST_URL, headers=HEADERS, timeout=HTTP_TIMEOUT
+                )
             r.raise_for_status()
             data = r.json()
             if data.get("status") != "OK":
@@ -300,32 +327,27 @@ class CodeforcesScraper(BaseScraper):
             return self._contests_error(str(e))
 
     async def stream_tests_for_category_async(self, category_id: str) -> None:
-        html = await asyncio.to_thread(_fetch_problems_html, category_id)
-        blocks = await asyncio.to_thread(_parse_all_blocks, html)
+        blocks = await self._get_blocks(category_id)
 
+        lines: list[str] = []
         for b in blocks:
             pid = b["letter"].lower()
-            tests: list[TestCase] = b.get("tests", [])
-            print(
-                json.dumps(
-                    {
-                        "problem_id": pid,
-                        "combined": {
-                            "input": b.get("combined_input", ""),
-                            "expected": b.get("combined_expected", ""),
-                        },
-                        "tests": [
-                            {"input": t.input, "expected": t.expected} for t in tests
-                        ],
-                        "timeout_ms": b.get("timeout_ms", 0),
-                        "memory_mb": b.get("memory_mb", 0),
-                        "interactive": bool(b.get("interactive")),
-                        "multi_test": bool(b.get("multi_test", False)),
-                        "precision": b.get("precision"),
-                    }
-                ),
-                flush=True,
-            )
+            payload = {
+                "problem_id": pid,
+                "combined": {
+                    "input": b.get("combined_input", ""),
+                    "expected": b.get("combined_expected", ""),
+                },
+                "tests": b.get("tests", []),
+                "timeout_ms": b.get("timeout_ms", 0),
+                "memory_mb": b.get("memory_mb", 0),
+                "interactive": bool(b.get("interactive")),
+                "multi_test": bool(b.get("multi_test", False)),
+                "precision": b.get("precision"),
+            }
+            lines.append(orjson.dumps(payload).decode())
+        if lines:
+            print("\n".join(lines), flush=True)
 
     async def submit(
         self,
@@ -5,21 +5,21 @@ class TestCase(BaseModel):
     input: str
     expected: str
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class CombinedTest(BaseModel):
     input: str
     expected: str
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class ProblemSummary(BaseModel):
     id: str
     name: str
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class ContestSummary(BaseModel):
@@ -28,14 +28,14 @@ class ContestSummary(BaseModel):
     display_name: str | None = None
     start_time: int | None = None
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class ScrapingResult(BaseModel):
     success: bool
     error: str
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class MetadataResult(ScrapingResult):
@@ -1,7 +1,9 @@
 import asyncio
+import contextlib
+import functools
 import importlib.util
 import io
-import json
+import socket
 import sys
 from pathlib import Path
 from types import SimpleNamespace
@@ -10,14 +12,15 @@ from typing import Any
 import re
 
 import httpx
+import orjson
 import pytest
-import requests
+import pytest_socket
 
 ROOT = Path(__file__).resolve().parent.parent
 FIX = Path(__file__).resolve().parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixture_text():
     def _load(name: str) -> str:
         p = FIX / name
@@ -26,6 +29,7 @@ def fixture_text():
     return _load
 
 
+@functools.cache
 def _load_scraper_module(module_path: Path, module_name: str):
     spec = importlib.util.spec_from_file_location(
         f"scrapers.{module_name}", module_path
@@ -39,19 +43,58 @@ def _load_scraper_module(module_path: Path, module_name: str):
 
 
 def _capture_stdout(coro):
-    buf = io.StringIO()
+    raw = io.BytesIO()
+    buf = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
     old = sys.stdout
     sys.stdout = buf
     try:
         rc = asyncio.run(coro)
-        out = buf.getvalue()
+        buf.flush()
+        out = raw.getvalue().decode()
     finally:
         sys.stdout = old
     return rc, out
 
 
-@pytest.fixture
-def run_scraper_offline(fixture_text):
+@contextlib.contextmanager
+def _blocked_network():
+    blocked: list[str] = []
+
+    def _record(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except pytest_socket.SocketBlockedError as e:
+                blocked.append(str(e))
+                raise
+
+        return wrapper
+
+    getaddrinfo, gethostbyname = socket.getaddrinfo, socket.gethostbyname
+    pytest_socket.disable_socket(allow_unix_socket=True)
+    guarded = socket.socket
+
+    class _RecordingSocket(guarded):
+        __new__ = staticmethod(_record(guarded.__new__))
+
+    socket.socket = _RecordingSocket  # ty: ignore[invalid-assignment]
+    socket.getaddrinfo = _record(socket.getaddrinfo)
+    socket.gethostbyname = _record(socket.gethostbyname)
+    try:
+        yield blocked
+    finally:
+        pytest_socket.enable_socket()
+        socket.getaddrinfo, socket.gethostbyname = getaddrinfo, gethostbyname
+
+
+@pytest.fixture(scope="session")
+def offline_cache() -> dict[tuple[str, str, tuple[str, ...]], tuple[int, list[Any]]]:
+    return {}
+
+
+@pytest.fixture(scope="session")
+def run_scraper_offline(fixture_text, offline_cache):
     def _router_cses(*, path: str | None = None, url: str | None = None) -> str:
         if not path and not url:
             raise AssertionError("CSES expects path or url")
@@ -171,7 +214,7 @@ def run_scraper_offline(fixture_text):
                         url=f"https://codeforces.com/contest/{cid}/problems"
                     )
 
-                def _mock_requests_get(url: str, **kwargs):
+                async def __offline_get_async(client, url: str, **kwargs):
                     if "api/contest.list" in url:
                         data = {
                             "status": "OK",
@@ -197,11 +240,11 @@ def run_scraper_offline(fixture_text):
                                 return None
 
                         return R()
-                    raise AssertionError(f"Unexpected requests.get call: {url}")
+                    raise AssertionError(f"Unexpected httpx call: {url}")
 
                 return {
                     "_fetch_problems_html": _mock_fetch_problems_html,
-                    "requests.get": _mock_requests_get,
+                    "__offline_get_async": __offline_get_async,
                 }
 
             case "codechef":
@@ -219,15 +262,15 @@ def run_scraper_offline(fixture_text):
 
                 async def __offline_get_async(client, url: str, **kwargs):
                     if "/api/list/contests/all" in url:
-                        data = json.loads(fixture_text("codechef/contests.json"))
+                        data = orjson.loads(fixture_text("codechef/contests.json"))
                         return MockResponse(data)
                     if "/api/list/contests/past" in url:
-                        data = json.loads(fixture_text("codechef/contests_past.json"))
+                        data = orjson.loads(fixture_text("codechef/contests_past.json"))
                         return MockResponse(data)
                     if "/api/contests/START" in url and "/problems/" not in url:
                         contest_id = url.rstrip("/").split("/")[-1]
                         try:
-                            data = json.loads(
+                            data = orjson.loads(
                                 fixture_text(f"codechef/{contest_id}.json")
                             )
                             return MockResponse(data)
@@ -237,7 +280,7 @@ def run_scraper_offline(fixture_text):
                         parts = url.rstrip("/").split("/")
                         contest_id = parts[-3]
                         problem_id = parts[-1]
-                        data = json.loads(
+                        data = orjson.loads(
                             fixture_text(f"codechef/{contest_id}_{problem_id}.json")
                         )
                         return MockResponse(data)
@@ -290,14 +333,14 @@ def run_scraper_offline(fixture_text):
         "usaco": "USACOScraper",
     }
 
-    def _run(scraper_name: str, mode: str, *args: str):
+    def _execute(scraper_name: str, mode: str, *args: str):
         mod_path = ROOT / "scrapers" / f"{scraper_name}.py"
         ns = _load_scraper_module(mod_path, scraper_name)
         offline_fetches = _make_offline_fetches(scraper_name)
 
         if scraper_name == "codeforces":
             ns._fetch_problems_html = offline_fetches["_fetch_problems_html"]
-            requests.get = offline_fetches["requests.get"]
+            httpx.AsyncClient.get = offline_fetches["__offline_get_async"]
         elif scraper_name == "atcoder":
             ns._fetch = offline_fetches["_fetch"]
             ns._get_async = offline_fetches["_get_async"]
@@ -310,11 +353,19 @@ def run_scraper_offline(fixture_text):
         scraper = scraper_class()
 
         argv = [str(mod_path), mode, *args]
-        rc, out = _capture_stdout(scraper._run_cli_async(argv))
+        with _blocked_network() as blocked:
+            rc, out = _capture_stdout(scraper._run_cli_async(argv))
+        assert not blocked, f"{scraper_name} {mode} tried the network: {blocked}"
 
-        json_lines: list[Any] = []
-        for line in (_line for _line in out.splitlines() if _line.strip()):
-            json_lines.append(json.loads(line))
+        json_lines: list[Any] = [
+            orjson.loads(line) for line in out.splitlines() if line.strip()
+        ]
         return rc, json_lines
 
+    def _run(scraper_name: str, mode: str, *args: str):
+        key = (scraper_name, mode, args)
+        if key not in offline_cache:
+            offline_cache[key] = _execute(scraper_name, mode, *args)
+        return offline_cache[key]
+
     return _run
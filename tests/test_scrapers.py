@@ -1,13 +1,38 @@
+from pathlib import Path
+from types import MappingProxyType
+
 import pytest
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from scrapers.language_ids import LANGUAGE_IDS
 from scrapers.models import (
+    CombinedTest,
     ContestListResult,
     MetadataResult,
-    TestsResult,
+    TestCase,
 )
 
-MATRIX = {
+FIX = Path(__file__).resolve().parent / "fixtures"
+
+
+class StreamedTests(BaseModel):
+    problem_id: str
+    combined: CombinedTest
+    tests: list[TestCase]
+    timeout_ms: int
+    memory_mb: float
+    interactive: bool
+    multi_test: bool
+    precision: float | None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+TESTS_ADAPTER = TypeAdapter(list[StreamedTests])
+
+REQUIRED_LANGS = frozenset(("cpp", "python"))
+
+_MATRIX = {
     "cses": {
         "metadata": ("introductory_problems",),
         "tests": ("introductory_problems",),
@@ -39,69 +64,55 @@ MATRIX = {
         "contests": tuple(),
     },
 }
+MATRIX = MappingProxyType({k: MappingProxyType(v) for k, v in _MATRIX.items()})
+
 
+def _case_marks(scraper: str, mode: str, args: tuple[str, ...]):
+    marks = [pytest.mark.xdist_group(scraper)]
+    if mode == "contests" and not args and not any((FIX / scraper).glob("contests.*")):
+        marks.append(pytest.mark.skip(reason="no contests fixture"))
+    return marks
+
+
+CASES = [
+    pytest.param(s, m, args, id=f"{s}-{m}", marks=_case_marks(s, m, args))
+    for s, modes in MATRIX.items()
+    for m, args in modes.items()
+]
+
+
+def _check_metadata(objs: list[dict]) -> None:
+    model = MetadataResult.model_validate(objs[-1])
+    assert model.success is True
+    assert model.url
+    ids = [p.id for p in model.problems]
+    assert ids and all(ids)
+
+
+def _check_contests(objs: list[dict]) -> None:
+    model = ContestListResult.model_validate(objs[-1])
+    assert model.success is True
+    assert len(model.contests) >= 1
 
-@pytest.mark.parametrize("scraper", MATRIX.keys())
-@pytest.mark.parametrize("mode", ["metadata", "tests", "contests"])
-def test_scraper_offline_fixture_matrix(run_scraper_offline, scraper, mode):
-    args = MATRIX[scraper][mode]
+
+def _check_tests(objs: list[dict]) -> None:
+    validated = TESTS_ADAPTER.validate_python(objs, strict=True)
+    assert all(tr.problem_id for tr in validated)
+
+
+CHECKS = {
+    "metadata": _check_metadata,
+    "contests": _check_contests,
+    "tests": _check_tests,
+}
+
+
+@pytest.mark.parametrize("scraper,mode,args", CASES)
+def test_scraper_offline_fixture_matrix(run_scraper_offline, scraper, mode, args):
     rc, objs = run_scraper_offline(scraper, mode, *args)
     assert rc in (0, 1), f"Bad exit code {rc}"
     assert objs, f"No JSON output for {scraper}:{mode}"
-
-    if mode == "metadata":
-        model = MetadataResult.model_validate(objs[-1])
-        assert model.success is True
-        assert model.url
-        assert len(model.problems) >= 1
-        assert all(isinstance(p.id, str) and p.id for p in model.problems)
-    elif mode == "contests":
-        model = ContestListResult.model_validate(objs[-1])
-        assert model.success is True
-        assert len(model.contests) >= 1
-    else:
-        assert len(objs) >= 1, "No test objects returned"
-        validated_any = False
-        for obj in objs:
-            if "success" in obj and "tests" in obj and "problem_id" in obj:
-                tr = TestsResult.model_validate(obj)
-                assert tr.problem_id != ""
-                assert isinstance(tr.tests, list)
-                assert hasattr(tr, "combined"), "Missing combined field"
-                assert tr.combined is not None, "combined field is None"
-                assert hasattr(tr.combined, "input"), "combined missing input"
-                assert hasattr(tr.combined, "expected"), "combined missing expected"
-                assert isinstance(tr.combined.input, str), "combined.input not string"
-                assert isinstance(tr.combined.expected, str), (
-                    "combined.expected not string"
-                )
-                assert hasattr(tr, "multi_test"), "Missing multi_test field"
-                assert isinstance(tr.multi_test, bool), "multi_test not boolean"
-                validated_any = True
-            else:
-                assert "problem_id" in obj
-                assert "tests" in obj and isinstance(obj["tests"], list)
-                assert (
-                    "timeout_ms" in obj and "memory_mb" in obj and "interactive" in obj
-                )
-                assert "combined" in obj, "Missing combined field in raw JSON"
-                assert isinstance(obj["combined"], dict), "combined not a dict"
-                assert "input" in obj["combined"], "combined missing input key"
-                assert "expected" in obj["combined"], "combined missing expected key"
-                assert isinstance(obj["combined"]["input"], str), (
-                    "combined.input not string"
-                )
-                assert isinstance(obj["combined"]["expected"], str), (
-                    "combined.expected not string"
-                )
-                assert "multi_test" in obj, "Missing multi_test field in raw JSON"
-                assert isinstance(obj["multi_test"], bool), "multi_test not boolean"
-                assert "precision" in obj, "Missing precision field in raw JSON"
-                assert obj["precision"] is None or isinstance(
-                    obj["precision"], float
-                ), "precision must be None or float"
-                validated_any = True
-        assert validated_any, "No valid tests payloads validated"
+    CHECKS[mode](objs)
 
 
 def test_kattis_contest_metadata(run_scraper_offline):
@@ -115,6 +126,36 @@ def test_kattis_contest_metadata(run_scraper_offline):
     assert model.standings_url != ""
 
 
+def test_codeforces_inline_title_markup(run_scraper_offline):
+    rc, objs = run_scraper_offline("codeforces", "metadata", "1551")
+    assert rc == 0
+    model = MetadataResult.model_validate(objs[-1])
+    assert [p.name for p in model.problems] == ["Foo Bar baz"]
+
+    rc, objs = run_scraper_offline("codeforces", "tests", "1551")
+    assert rc == 0
+    assert objs[0]["timeout_ms"] == 2000
+    assert objs[0]["memory_mb"] == 512
+    assert objs[0]["interactive"] is True
+    assert objs[0]["precision"] == 1e-6
+
+
+def test_codeforces_grouped_samples(run_scraper_offline):
+    rc, objs = run_scraper_offline("codeforces", "tests", "1552")
+    assert rc == 0
+    payload = objs[0]
+    assert payload["multi_test"] is True
+    assert payload["combined"] == {
+        "input": "3\n2\n1 2\n1\n5\n3\n4 5 6",
+        "expected": "3\n5\n15",
+    }
+    assert payload["tests"] == [
+        {"input": "1\n2\n1 2", "expected": "3"},
+        {"input": "1\n1\n5", "expected": "5"},
+        {"input": "1\n3\n4 5 6", "expected": "15"},
+    ]
+
+
 def test_usaco_precision_extracted(run_scraper_offline):
     rc, objs = run_scraper_offline("usaco", "tests", "dec24_gold")
     assert rc == 0
@@ -151,6 +192,6 @@ def test_language_ids_coverage():
     }
     assert set(LANGUAGE_IDS.keys()) == expected_platforms
     for platform, langs in LANGUAGE_IDS.items():
-        assert {"cpp", "python"} <= set(langs.keys()), f"{platform} missing cpp/python"
+        assert REQUIRED_LANGS.issubset(langs), f"{platform} missing cpp/python"
         for lang, lid in langs.items():
             assert isinstance(lid, str) and lid, f"{platform}/{lang} empty ID"